@@ -1,23 +1,39 @@
 #!/usr/bin/env python3
 import os
+import sys
 from fastmcp import FastMCP
 
 mcp = FastMCP("Sample MCP Server")
 
+# Server info never changes at runtime, so build it once at import.
+SERVER_INFO = {
+    "server_name": "Sample MCP Server",
+    "version": "1.0.0",
+    "environment": os.environ.get("ENVIRONMENT", "development"),
+    "python_version": sys.version.split()[0]
+}
+
 @mcp.tool(description="Greet a user by name with a welcome message from the MCP server")
 def greet(name: str) -> str:
     return f"Hello, {name}! Welcome to our sample MCP server running on Heroku!"
 
 @mcp.tool(description="Get information about the MCP server including name, version, environment, and Python version")
 def get_server_info() -> dict:
-    return {
-        "server_name": "Sample MCP Server",
-        "version": "1.0.0",
-        "environment": os.environ.get("ENVIRONMENT", "development"),
-        "python_version": os.sys.version.split()[0]
-    }
+    return dict(SERVER_INFO)
 
 if __name__ == "__main__":
+    # FastMCP starts its own event loop via anyio, so uvicorn never picks
+    # the loop itself; set uvloop's policy before mcp.run. The policy API is
+    # deprecated as of Python 3.14 and is a stopgap until FastMCP exposes a
+    # loop_factory / use_uvloop option for anyio.run. Without uvloop (e.g. on
+    # Windows) the server falls back to the standard asyncio loop.
+    try:
+        import asyncio
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     port = int(os.environ.get("PORT", 8000))
     host = "0.0.0.0"
     